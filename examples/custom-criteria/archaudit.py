@@ -6,6 +6,8 @@ import subprocess
 class SiunCriterion:
     """Custom criterion."""
 
+    requires_updates = True
+
     def is_fulfilled(self, criteria_settings: dict, available_updates: list):
         """Check if any available updates are in arch-audit list."""
         audit_packages = []
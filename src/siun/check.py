@@ -12,6 +12,7 @@ from siun.models import V2Criterion, V2Threshold
 from siun.models.updates import Updates
 from siun.providers import UpdateProvider
 from siun.state import get_package_updates, load_state
+from siun.util import utc_now
 
 
 def _is_cache_stale(existing_state, now, min_age):
@@ -45,7 +46,7 @@ def get_updates(
     criteria_dict: dict[str, SiunCriterion],
 ) -> Updates:
     """Get available updates and evaluate criteria."""
-    now = datetime.datetime.now(tz=datetime.UTC)
+    now = utc_now()
     cache_min_age = datetime.timedelta(minutes=cache_min_age_minutes)
 
     if no_cache:
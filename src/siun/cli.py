@@ -15,7 +15,7 @@ from siun.errors import (
     SiunNotificationError,
 )
 from siun.formatting import OutputFormat, get_formatted_state_text
-from siun.models import CRITERION_REGISTRY, NewsEntry
+from siun.models import CRITERION_REGISTRY, FormatObject, NewsEntry
 from siun.models.updates import Updates
 from siun.news import INSTALLED_FEATURES as INSTALLED_NEWS_FEATURES
 from siun.news import (
@@ -31,7 +31,7 @@ CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 INSTALLED_FEATURES: set[str] = INSTALLED_NOTIFICATION_FEATURES | INSTALLED_NEWS_FEATURES
 
 
-def _handle_notification(config: SiunConfig, siun_state: Updates) -> None:
+def _handle_notification(config: SiunConfig, siun_state: Updates, format_object: FormatObject | None = None) -> None:
     notification = config.notification
     if not notification:
         return None
@@ -48,7 +48,7 @@ def _handle_notification(config: SiunConfig, siun_state: Updates) -> None:
     ):
         return None
 
-    notification.fill_templates(siun_state.format_object)
+    notification.fill_templates(siun_state.format_object if format_object is None else format_object)
     if notification.urgency is not None:
         notification.hints = {"urgency": notification.urgency.value}
     notification.show()
@@ -130,11 +130,14 @@ def check(
     except SiunGetUpdatesError as error:
         raise SiunCLIError(error.message) from error
 
+    # Only build format object if needed, and share it with the notification
+    format_object = None
     if not quiet:
-        formatted_output = get_formatted_state_text(siun_state.format_object, output_format, config.custom_format)
+        format_object = siun_state.format_object
+        formatted_output = get_formatted_state_text(format_object, output_format, config.custom_format)
         click.echo(formatted_output)
 
     try:
-        _handle_notification(config, siun_state)
+        _handle_notification(config, siun_state, format_object)
     except SiunNotificationError as error:
         raise SiunCLIError(error.message) from error
@@ -7,6 +7,9 @@ from typing import Any
 class SiunCriterion:
     """Base class for criteria."""
 
+    # Criteria which can only be fulfilled by available updates get skipped if there are none
+    requires_updates: bool = False
+
     def is_fulfilled(self, criteria_settings: dict[str, Any], available_updates: list[str]) -> bool:
         """Override me."""
         raise NotImplementedError
@@ -15,6 +18,8 @@ class SiunCriterion:
 class CriterionAvailable(SiunCriterion):
     """Check if there are any available updates."""
 
+    requires_updates = True
+
     def is_fulfilled(self, criteria_settings: dict[str, Any], available_updates: list[str]) -> bool:
         """Check criterion."""
         return bool(available_updates)
@@ -32,9 +37,11 @@ class CriterionCount(SiunCriterion):
 class CriterionPattern(SiunCriterion):
     """Check if list of available updates contains updates according to pattern."""
 
+    requires_updates = True
+
     def is_fulfilled(self, criteria_settings: dict[str, Any], available_updates: list[str]) -> bool:
         """Check criterion."""
         regex = re.compile(criteria_settings["pattern"])
-        matches = list(filter(regex.match, available_updates))
 
-        return bool(matches)
+        # Stop at the first match instead of collecting all of them
+        return any(map(regex.match, available_updates))
@@ -35,12 +35,12 @@ class Formatter:
     @staticmethod
     def format_json(format_object: FormatObject) -> tuple[str, dict[Never, Never]]:
         """Build JSON output format."""
-        state_dict = {
-            "count": format_object.update_count,
-            "text_value": format_object.status_text,
-            "score": format_object.score,
-        }
-        return json.dumps(state_dict), {}
+        # Shape is fixed and numbers are validated ints, so only the text needs JSON encoding
+        return (
+            f'{{"count": {format_object.update_count}, '
+            f'"text_value": {json.dumps(format_object.status_text)}, '
+            f'"score": {format_object.score}}}'
+        ), {}
 
     @staticmethod
     def format_custom(format_object: FormatObject, template_string: str) -> tuple[str, dict[Never, Never]]:
@@ -50,13 +50,14 @@ class Formatter:
         return output, {}
 
 
+# Formatter methods are static, so they can be looked up once instead of per call
+FORMATTERS = {output_format: getattr(Formatter, f"format_{output_format.value}") for output_format in OutputFormat}
+
+
 def get_formatted_state_text(format_object: FormatObject, output_format: OutputFormat, custom_format: str) -> str:
     """Generate formatted output text from update state."""
-    formatter = Formatter()
     formatter_kwargs = {}
     if output_format == OutputFormat.CUSTOM:
         formatter_kwargs["template_string"] = custom_format
-    formatted_output, format_options = getattr(formatter, f"format_{output_format.value}")(
-        format_object, **formatter_kwargs
-    )
+    formatted_output, format_options = FORMATTERS[output_format](format_object, **formatter_kwargs)
     return click_style(formatted_output, **format_options)
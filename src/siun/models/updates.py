@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import datetime
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from siun.criteria import SiunCriterion
 from siun.models.criteria import V2Criterion
 from siun.models.formatting import ClickColor, FormatObject
 from siun.models.thresholds import V2Threshold
+from siun.util import utc_now
 
 
 class PackageUpdate(BaseModel):
@@ -25,6 +27,10 @@ class PackageUpdate(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+# Used for display if no threshold matched
+NO_MATCH_THRESHOLD = V2Threshold(score=0, name="no_match", text="No matches.", color=ClickColor.reset)
+
+
 class Updates(BaseModel):
     """Internal state struct."""
 
@@ -32,72 +38,72 @@ class Updates(BaseModel):
     thresholds: list[V2Threshold] = []
     available_updates: list[PackageUpdate] = []
     matched_criteria: dict[str, dict[str, Any]] = {}
-    last_update: datetime.datetime = datetime.datetime.now(tz=datetime.UTC)
+    # Resolve utc_now at call time, binding it directly would ignore the patched clock in tests
+    last_update: datetime.datetime = Field(default_factory=lambda: utc_now())
     match: V2Threshold | None = None
     last_match: V2Threshold | None = None
 
     def touch(self) -> None:
         """Set last_update to now."""
-        self.last_update = datetime.datetime.now(tz=datetime.UTC)
+        self.last_update = utc_now()
 
     @property
     def score(self) -> int:
         """Calculate score from criteria weights."""
-        return sum([criterium["weight"] for criterium in self.matched_criteria.values()])
+        return sum(criterium["weight"] for criterium in self.matched_criteria.values())
 
     @property
     def count(self) -> int:
         """Get count of available updates."""
         return len(self.available_updates)
 
+    @property
+    def display_threshold(self) -> V2Threshold:
+        """Get matched threshold, or a placeholder threshold if nothing matched."""
+        return self.match or NO_MATCH_THRESHOLD
+
     @property
     def color(self) -> ClickColor:
         """Get color of matched threshold."""
-        if not self.match:
-            return ClickColor.reset
-        return self.match.color
+        return self.display_threshold.color
 
     @property
     def text_value(self) -> str:
         """Get text value of matched threshold."""
-        if not self.match:
-            return "No matches."
-        return self.match.text
+        return self.display_threshold.text
 
     @property
     def format_object(self) -> FormatObject:
         """Provide prepared values for formatters."""
+        threshold = self.display_threshold
         return FormatObject(
             available_updates=", ".join([update.name for update in self.available_updates]),
             last_update=self.last_update.replace(microsecond=0).isoformat(),
             matched_criteria=", ".join(self.matched_criteria.keys()),
             matched_criteria_short=",".join([match["name_short"] for match in self.matched_criteria.values()]),
             score=self.score,
-            status_text=self.text_value,
+            status_text=threshold.text,
             update_count=self.count,
-            state_color=self.color.value,
-            state_name=self.text_value,
+            state_color=threshold.color.value,
+            state_name=threshold.text,
         )
 
     def evaluate(
         self,
         criteria: dict[str, SiunCriterion],
-        available_updates: list[PackageUpdate] | None = None,
+        available_updates: Sequence[PackageUpdate] = (),
     ) -> None:
         """Update state of updates. Criteria must be passed in."""
         self.touch()
-        if available_updates is None:
-            available_updates = []
-
-        self.available_updates = available_updates
+        self.available_updates = list(available_updates)
         self.matched_criteria = {}  # Reset matches
+        package_names = [update.name for update in self.available_updates]
 
         # Check criteria
         for crit in self.criteria_settings:
             if crit and crit.weight == 0:
                 continue  # Skip criteria with weight 0
             try:
-                user_criteria_settings = crit.model_dump(exclude={"name", "short_name"})
                 if crit.name not in criteria:
                     message = (
                         f"Configured criterion '{crit.name}' was not loaded. "
@@ -110,9 +116,11 @@ class Updates(BaseModel):
                     from siun.errors import CriterionError
 
                     raise CriterionError(message, crit.name)
-                if criteria[crit.name].is_fulfilled(
-                    user_criteria_settings, [update.name for update in available_updates]
-                ):
+                criterion = criteria[crit.name]
+                if not package_names and getattr(criterion, "requires_updates", False):
+                    continue  # Skip criteria which can't be fulfilled without available updates
+                user_criteria_settings = crit.model_dump(exclude={"name", "short_name"})
+                if criterion.is_fulfilled(user_criteria_settings, package_names):
                     self.matched_criteria[crit.name] = user_criteria_settings
             except Exception as error:
                 from siun.errors import CriterionError
@@ -124,8 +132,9 @@ class Updates(BaseModel):
                 message = f"Criterion settings: {crit_settings}\nTraceback:\n{tb}"
                 raise CriterionError(message, crit.name) from error
 
+        score = self.score  # Matched criteria don't change anymore, only sum weights once
         for threshold in self.thresholds:
-            if self.score >= threshold.score:
+            if score >= threshold.score:
                 self.match = threshold
                 break
         else:
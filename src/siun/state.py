@@ -66,12 +66,13 @@ def _load_user_criteria(*, criteria_settings: list[CriterionT], include_path: Pa
 
 def load_state(state_file_path: Path) -> Updates | None:
     """Read state from disk."""
-    if not state_file_path.exists():
+    try:
+        # pydantic parses raw bytes natively, no need for a text decoding layer
+        with Path.open(state_file_path, "rb") as update_file:
+            return Updates.model_validate_json(update_file.read())
+    except FileNotFoundError:
         return None
 
-    with Path.open(state_file_path) as update_file:
-        return Updates.model_validate_json(update_file.read())
-
 
 def get_package_updates(update_providers: list[UpdateProvider]) -> list[PackageUpdate]:
     """Fetch available package updates."""
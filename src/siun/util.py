@@ -1,11 +1,18 @@
 """Common utils."""
 
-import shutil
+import datetime
 import stat
 import tempfile
 from os import environ
 from pathlib import Path
 
+_UTC = datetime.UTC
+
+
+def utc_now() -> datetime.datetime:
+    """Get current time in UTC."""
+    return datetime.datetime.now(tz=_UTC)
+
 
 def get_default_state_dir() -> Path:
     """
@@ -45,17 +52,25 @@ def safely_write_to_disk(*, content: str, target_path: Path) -> None:
     Safely write to disk.
 
     Avoids partially written state file (and therefore invalid JSON) by
-    creating a temporary file first and only replacing the state file once
-    the writing operation is done.
+    creating a temporary file next to the target first and only replacing the
+    state file once the writing operation is done. Creating the temporary file
+    in the target directory allows a cheap rename instead of a full copy.
     """
     if not Path.exists(target_path.parent):
         # Create parent directory for state file path if it doesn't exist
         Path.mkdir(Path(target_path.parent), parents=True, exist_ok=True)
 
-    with tempfile.NamedTemporaryFile(mode="w+") as update_file:
-        update_file.write(content)
-        update_file.flush()
-        shutil.copy(update_file.name, target_path)
+    with tempfile.NamedTemporaryFile(
+        mode="w", dir=target_path.parent, prefix=f".{target_path.name}.", delete=False
+    ) as update_file:
+        temp_path = Path(update_file.name)
+        try:
+            update_file.write(content)
+            update_file.flush()
+            temp_path.replace(target_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
 
 def is_path_world_writable(path: Path) -> bool:
@@ -0,0 +1,59 @@
+"""Test check command with the optional notification feature."""
+
+from unittest import mock
+
+import pytest
+
+from siun.models import PackageUpdate
+
+pytestmark = pytest.mark.feature_notification
+
+
+@pytest.mark.usefixtures("patch_is_path_world_writable")
+class TestCheckNotification:
+    """Test check command notifications."""
+
+    @mock.patch("siun.notification.UpdateNotification.show")
+    def test_check_notification(self, mock_show, patched_check, config_w_notification, invoke_check, capsys):
+        """Test check CLI command with notification."""
+        patched_check.fetch_updates.return_value = [PackageUpdate(name="package", provider="pacman")]
+        patched_check.get_config.return_value = config_w_notification
+        exit_code = invoke_check(cache=False)
+        captured = capsys.readouterr()
+        patched_check.fetch_updates.assert_called_once()
+        mock_show.assert_called_once()
+        assert exit_code == 0
+        assert captured.out == "Updates available\n"
+
+    @mock.patch("siun.notification.UpdateNotification.show")
+    def test_check_notification_below_threshold(
+        self, mock_show, patched_check, config_w_notification_threshold, state_stale, invoke_check, capsys
+    ):
+        """Test state below threshold does not show notification."""
+        patched_check.fetch_updates.return_value = [PackageUpdate(name="siun", provider="pacman")]
+        patched_check.get_config.return_value = config_w_notification_threshold
+        # `available` state is below notification threshold
+        patched_check.load_state.return_value = state_stale
+        exit_code = invoke_check()
+        captured = capsys.readouterr()
+        mock_show.assert_not_called()
+        assert exit_code == 0
+        assert captured.out == "Updates available\n"
+
+    @mock.patch("siun.notification.UpdateNotification.show")
+    def test_check_notification_above_threshold(
+        self, mock_show, patched_check, config_w_notification_threshold, state_stale, invoke_check, capsys
+    ):
+        """Test state gte threshold shows notification."""
+        patched_check.fetch_updates.return_value = [
+            PackageUpdate(name="package", provider="pacman"),
+            PackageUpdate(name="other_package", provider="pacman"),
+        ]
+        patched_check.get_config.return_value = config_w_notification_threshold
+        # `warning` state exceeds notification threshold
+        patched_check.load_state.return_value = state_stale
+        exit_code = invoke_check()
+        captured = capsys.readouterr()
+        mock_show.assert_called_once()
+        assert exit_code == 0
+        assert captured.out == "Updates recommended\n"
@@ -1,13 +1,12 @@
 """Test news command."""
 
-import tempfile
 from pathlib import Path
 from unittest import mock
 
 import pytest
-from click.testing import CliRunner
 
 from siun.cli import news
+from siun.errors import SiunCLIError
 from siun.models import NewsProvider
 
 DUMMY_FEED_DATA = """<?xml version="1.0" encoding="UTF-8"?>
@@ -42,74 +41,69 @@ class TestNewsCommand:
     @pytest.mark.usefixtures("os_path_isfile_patch")
     @mock.patch("siun.cli_utils.get_config")
     @mock.patch("siun.cli.save_news_state")
-    def test_news_command(self, mock_save_news_state, mock_get_config):
+    def test_news_command(self, mock_save_news_state, mock_get_config, tmp_path, capsys):
         """Test news CLI command with one source."""
         import feedparser
 
         dummy_news_source = [mock.Mock(url="dummy-url", title=None, max_items=3)]
         dummy_config = mock.Mock()
         dummy_config.news = dummy_news_source
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dummy_config.state_dir = Path(tmpdir)
-            mock_get_config.return_value = dummy_config
+        dummy_config.state_dir = tmp_path
+        mock_get_config.return_value = dummy_config
 
-            runner = CliRunner()
-            # Let the library parse the dummy data so it can be substituted in the test call below
-            parsed_feed = feedparser.parse(DUMMY_FEED_DATA)
-            with mock.patch("siun.news.feedparser.parse", return_value=parsed_feed) as mock_feedparser_parse:
-                result = runner.invoke(news, [])
-
-                mock_feedparser_parse.assert_called_once()
-                assert mock_feedparser_parse.call_args[0][0] == "dummy-url"
-                assert result.exit_code == 0
-                assert "PyPI recent updates for siun" in result.output
-                # Titles
-                assert "- 1.5.1" in result.output
-                assert "- 1.5.0" in result.output
-                assert "- 1.4.1" in result.output
-                # Links
-                assert "https://pypi.org/project/siun/1.5.1" in result.output
-                assert "https://pypi.org/project/siun/1.5.0" in result.output
-                assert "https://pypi.org/project/siun/1.4.1" in result.output
-                # Publish dates
-                assert "2025-09-20" in result.output
-                assert "2025-05-30" in result.output
-                assert "2025-05-12" in result.output
+        # Let the library parse the dummy data so it can be substituted in the test call below
+        parsed_feed = feedparser.parse(DUMMY_FEED_DATA)
+        with mock.patch("siun.news.feedparser.parse", return_value=parsed_feed) as mock_feedparser_parse:
+            news.callback(config_path=None, nocolor=False)
+            output = capsys.readouterr().out
+
+            mock_feedparser_parse.assert_called_once()
+            assert mock_feedparser_parse.call_args[0][0] == "dummy-url"
+            assert "PyPI recent updates for siun" in output
+            # Titles
+            assert "- 1.5.1" in output
+            assert "- 1.5.0" in output
+            assert "- 1.4.1" in output
+            # Links
+            assert "https://pypi.org/project/siun/1.5.1" in output
+            assert "https://pypi.org/project/siun/1.5.0" in output
+            assert "https://pypi.org/project/siun/1.4.1" in output
+            # Publish dates
+            assert "2025-09-20" in output
+            assert "2025-05-30" in output
+            assert "2025-05-12" in output
 
     @pytest.mark.feature_news
     @mock.patch("siun.cli_utils.get_config")
-    def test_news_feature_not_installed(self, mock_get_config):
+    def test_news_feature_not_installed(self, mock_get_config, tmp_path):
         """Test error when news feature is not installed."""
         dummy_config = mock.Mock()
         dummy_config.news = [mock.Mock(url="dummy-url", title=None, max_items=3)]
-        with tempfile.TemporaryDirectory() as tmpdir, mock.patch("siun.cli.INSTALLED_FEATURES", set()):
-            dummy_config.state_dir = Path(tmpdir)
+        with mock.patch("siun.cli.INSTALLED_FEATURES", set()):
+            dummy_config.state_dir = tmp_path
             mock_get_config.return_value = dummy_config
 
-            runner = CliRunner()
-            result = runner.invoke(news, [])
-            assert result.exit_code != 0
-            assert "news require the 'news' feature" in result.output
+            with pytest.raises(SiunCLIError) as excinfo:
+                news.callback(config_path=None, nocolor=False)
+            assert "news require the 'news' feature" in excinfo.value.message
 
     @pytest.mark.feature_news
     @mock.patch("siun.cli_utils.get_config")
-    def test_news_command_no_sources(self, mock_get_config):
+    def test_news_command_no_sources(self, mock_get_config, tmp_path, capsys):
         """Test news CLI command with no sources configured."""
         dummy_config = mock.Mock()
         dummy_config.news = []
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dummy_config.state_dir = Path(tmpdir)
-            mock_get_config.return_value = dummy_config
+        dummy_config.state_dir = tmp_path
+        mock_get_config.return_value = dummy_config
 
-            runner = CliRunner()
-            result = runner.invoke(news, [])
+        news.callback(config_path=None, nocolor=False)
+        output = capsys.readouterr().out
 
-        assert result.exit_code == 0
-        assert "No new entries" in result.output or result.output.strip() == ""
+        assert "No new entries" in output or output.strip() == ""
 
     @pytest.mark.feature_news
     @mock.patch("siun.cli_utils.get_config")
-    def test_news_command_empty_feed(self, mock_get_config):
+    def test_news_command_empty_feed(self, mock_get_config, capsys):
         """Test news CLI command with a feed that returns no entries."""
         import feedparser
 
@@ -126,39 +120,36 @@ class TestNewsCommand:
         dummy_config.state_dir = Path("/tmp/siun-tests")  # noqa: S108
         mock_get_config.return_value = dummy_config
 
-        runner = CliRunner()
         parsed_feed = feedparser.parse(DUMMY_FEED_DATA)
         parsed_feed.feed = {"title": "Empty Feed"}
         parsed_feed.entries = []
         with mock.patch("siun.news.feedparser.parse", return_value=parsed_feed):
-            result = runner.invoke(news, [])
-            assert result.exit_code == 0
-            assert "Empty Feed" in result.output
-            assert "No new entries" in result.output
+            news.callback(config_path=None, nocolor=False)
+            output = capsys.readouterr().out
+            assert "Empty Feed" in output
+            assert "No new entries" in output
 
     @pytest.mark.feature_news
     @mock.patch("siun.cli_utils.get_config")
     @mock.patch("siun.cli.save_news_state")
     @mock.patch("siun.cli.load_news_state")
-    def test_news_command_nocolor(self, mock_load_news_state, mock_save_news_state, mock_get_config):
+    def test_news_command_nocolor(self, mock_load_news_state, mock_save_news_state, mock_get_config, tmp_path, runner):
         """Test news CLI command with --nocolor option."""
         import feedparser
 
         dummy_news_source = [mock.Mock(url="dummy-url", title=None, max_items=1)]
         dummy_config = mock.Mock()
         dummy_config.news = dummy_news_source
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dummy_config.state_dir = Path(tmpdir)
-            mock_get_config.return_value = dummy_config
+        dummy_config.state_dir = tmp_path
+        mock_get_config.return_value = dummy_config
 
-            runner = CliRunner()
-            parsed_feed = feedparser.parse(DUMMY_FEED_DATA)
-            with mock.patch("siun.news.feedparser.parse", return_value=parsed_feed):
-                result = runner.invoke(news, ["--nocolor"])
-                assert result.exit_code == 0
-                # Should not contain ANSI color codes
-                assert "\x1b[" not in result.output
-                assert "PyPI recent updates for siun" in result.output
+        parsed_feed = feedparser.parse(DUMMY_FEED_DATA)
+        with mock.patch("siun.news.feedparser.parse", return_value=parsed_feed):
+            result = runner.invoke(news, ["--nocolor"], standalone_mode=False, catch_exceptions=False)
+            assert result.exit_code == 0
+            # Should not contain ANSI color codes
+            assert "\x1b[" not in result.output
+            assert "PyPI recent updates for siun" in result.output
 
 
 @pytest.fixture(autouse=True)
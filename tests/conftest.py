@@ -2,11 +2,16 @@
 
 import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+from click import ClickException
+from click.testing import CliRunner
 
+from siun.cli import check
 from siun.config import SiunConfig, get_default_thresholds
+from siun.formatting import OutputFormat
 from siun.models import (
     CriterionAvailable,
     CriterionCount,
@@ -18,6 +23,9 @@ from siun.models import (
 )
 from siun.providers import UpdateProvider, UpdateProviderPacman
 
+# Frozen current time, state fixtures are relative to it
+NOW = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+
 
 class DummyProvider(UpdateProvider):
     """Dummy provider for testing."""
@@ -29,19 +37,36 @@ class DummyProvider(UpdateProvider):
         return []
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _home():
+    """Override `$HOME` and unset XDG base directories for consistent tests."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("HOME", "/tmp/siun-tests")  # noqa: S108
+        for variable in ("XDG_CONFIG_HOME", "XDG_STATE_HOME"):
+            monkeypatch.delenv(variable, raising=False)
+        yield
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide CLI runner, invocations don't share state so one runner is enough."""
+    return CliRunner()
+
+
 @pytest.fixture(scope="module")
 def default_update_providers():
     """Provide default update provider."""
     return [UpdateProviderPacman()]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def default_thresholds():
     """Provide default thresholds."""
     return get_default_thresholds()
 
 
-@pytest.fixture(scope="module")
+# Configs are read-only in tests, so they are only built once per session
+@pytest.fixture(scope="session")
 def default_config(default_thresholds):
     """Provide default config."""
     return SiunConfig(
@@ -59,7 +84,7 @@ def default_config(default_thresholds):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def config_w_notification(default_thresholds):
     """Provide default config."""
     return SiunConfig(
@@ -77,7 +102,7 @@ def config_w_notification(default_thresholds):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def config_w_notification_threshold(default_thresholds):
     """Provide default config."""
     return SiunConfig(
@@ -95,7 +120,7 @@ def config_w_notification_threshold(default_thresholds):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def v2_config_w_custom_format(default_thresholds):
     """Provide default config."""
     return SiunConfig(
@@ -113,16 +138,20 @@ def v2_config_w_custom_format(default_thresholds):
 
 
 @pytest.fixture
-def state_stale(default_thresholds):
+def state_empty(updates_factory):
+    """Fresh Update state without available updates."""
+    return updates_factory()
+
+
+@pytest.fixture
+def state_stale(updates_factory):
     """Expired Update state."""
-    return Updates(
+    return updates_factory(
         criteria_settings=[
             CriterionAvailable(name="available", weight=1),
             CriterionCount(name="count", weight=1, count=2),
         ],
-        thresholds_settings=default_thresholds,  # ty: ignore[unknown-argument]
-        available_updates=[],
-        last_update=datetime.datetime.now(tz=datetime.UTC) - datetime.timedelta(days=1),
+        last_update=NOW - datetime.timedelta(days=1),
     )
 
 
@@ -155,6 +184,43 @@ def updates_multiple(count: int = 2):
     return updates
 
 
+@pytest.fixture(scope="session")
+def updates_factory(default_config, default_thresholds):
+    """Build factory for Updates instances with default criteria and thresholds."""
+    template = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria, last_update=NOW)
+
+    def _make(**kwargs):
+        # Copying skips validation; deep copy keeps tests from sharing mutable fields
+        return template.model_copy(update=kwargs, deep=True)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def invoke_check():
+    """Build helper calling check command directly, skipping click's argument parsing and output redirection."""
+
+    def _invoke(**kwargs) -> int:
+        options = {
+            "config_path": None,
+            "output_format": OutputFormat.PLAIN,
+            "cache": True,
+            "no_update": False,
+            "list_criteria": False,
+            "quiet": False,
+        } | kwargs
+        try:
+            check.callback(**options)
+        except ClickException as error:
+            error.show()
+            return error.exit_code
+        except SystemExit as error:
+            return error.code
+        return 0
+
+    return _invoke
+
+
 @pytest.fixture(scope="module")
 def format_object_ok():
     """FormatObject with 'Ok' status."""
@@ -241,6 +307,44 @@ def format_object_factory():
     return _make
 
 
+@pytest.fixture
+def patched_check(monkeypatch):
+    """Patch state persistence, update fetching and config loading of the check command."""
+    # Plain mocks are enough, none of the patched callables need magic methods
+    patched = SimpleNamespace(
+        persist_state=mock.Mock(),
+        load_state=mock.Mock(),
+        fetch_updates=mock.Mock(return_value=[]),
+        get_config=mock.Mock(),
+    )
+    # Plain attribute replacement, monkeypatch restores the originals on teardown
+    monkeypatch.setattr("siun.cli.Updates.persist_state", patched.persist_state)
+    monkeypatch.setattr("siun.check.load_state", patched.load_state)
+    monkeypatch.setattr("siun.providers.UpdateProviderPacman.fetch_updates", patched.fetch_updates)
+    monkeypatch.setattr("siun.cli_utils.get_config", patched.get_config)
+    return patched
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Freeze the current time checked against state last_update."""
+    monkeypatch.setattr("siun.check.utc_now", lambda: NOW)
+    monkeypatch.setattr("siun.models.updates.utc_now", lambda: NOW)
+    return NOW
+
+
+@pytest.fixture(autouse=True)
+def installed_features(request, monkeypatch):
+    """Set installed features according to the `feature_*` markers of a test."""
+    features = {
+        marker.name.removeprefix("feature_")
+        for marker in request.node.iter_markers()
+        if marker.name.startswith("feature_")
+    }
+    monkeypatch.setattr("siun.cli.INSTALLED_FEATURES", features)
+    return features
+
+
 @pytest.fixture(autouse=True, scope="class")
 def patch_is_path_world_writable(request):
     """Mock is_path_world_writable to always return False to avoid early exit."""
@@ -1,7 +1,6 @@
 """Test config module."""
 
 import tomllib
-from os import environ
 from pathlib import Path
 from unittest import mock
 
@@ -104,20 +103,36 @@ title = "Test Title"
 max_items = 1
 """
 
-# Override `$HOME` for consistent tests
-environ["HOME"] = "/tmp/siun-tests"  # noqa: S108
+# Parse each config once and share the result between tests
+PARSED_MISSING_WEIGHTS = tomllib.loads(CONFIG_MISSING_WEIGHTS)
+PARSED_CUSTOM_STATE_DIR = tomllib.loads(CONFIG_CUSTOM_STATE_DIR)
+PARSED_W_INVALID_NOTIFICATION_THRESHOLD = tomllib.loads(CONFIG_W_INVALID_NOTIFICATION_THRESHOLD)
+PARSED_W_NEWS = tomllib.loads(CONFIG_W_NEWS)
+PARSED_LEGACY_THRESHOLDS = tomllib.loads(CONFIG_LEGACY_THRESHOLDS)
+PARSED_V2_THRESHOLDS = tomllib.loads(CONFIG_V2_THRESHOLDS)
+PARSED_W_DUPLICATE_T_NAMES = tomllib.loads(CONFIG_W_DUPLICATE_T_NAMES)
+PARSED_LEGACY_CRITERIA = tomllib.loads(CONFIG_LEGACY_CRITERIA)
 
 
-def mock_read_config(_):
-    """Mock empty config file."""
-    return tomllib.loads("")
+@pytest.fixture(autouse=True)
+def mock_read_config(request, monkeypatch):
+    """
+    Mock reading the config file.
+
+    The parsed config file content can be set with the `read_config` marker,
+    an empty config file is assumed otherwise.
+    """
+    marker = request.node.get_closest_marker("read_config")
+    args, kwargs = (marker.args, marker.kwargs) if marker else ((), {})
+    read_config = mock.Mock(return_value=args[0] if args else {}, **kwargs)
+    monkeypatch.setattr("siun.config._read_config", read_config)
+    return read_config
 
 
 @pytest.mark.usefixtures("patch_is_path_world_writable")
 class TestConfig:
     """Test Config class."""
 
-    @mock.patch("siun.config._read_config", mock_read_config)
     def test_default_config(self, default_config, default_update_providers):
         """Test empty user config."""
         with (
@@ -129,7 +144,7 @@ class TestConfig:
         assert config == default_config
         assert config.update_providers == default_update_providers
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_MISSING_WEIGHTS))
+    @pytest.mark.read_config(PARSED_MISSING_WEIGHTS)
     def test_missing_weights(self, mock_read_config):
         """Test user config with missing weights."""
         with mock.patch("siun.config.get_default_config_dir"), pytest.raises(ConfigError) as exc_info:
@@ -138,7 +153,7 @@ class TestConfig:
         mock_read_config.assert_called_once()
         assert "'v2_criteria.0.weight': Field required" in str(exc_info.value)
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_CUSTOM_STATE_DIR))
+    @pytest.mark.read_config(PARSED_CUSTOM_STATE_DIR)
     def test_custom_state_dir(self, mock_read_config, default_config):
         """Test custom state file path."""
         with mock.patch("siun.config.get_default_config_dir"):
@@ -148,8 +163,8 @@ class TestConfig:
 
         mock_read_config.assert_called_once()
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_W_INVALID_NOTIFICATION_THRESHOLD))
-    def test_invalid_notification_threshold(self, mock_read_config, default_config):
+    @pytest.mark.read_config(PARSED_W_INVALID_NOTIFICATION_THRESHOLD)
+    def test_invalid_notification_threshold(self, mock_read_config):
         """Test notification.threshold validation."""
         with mock.patch("siun.config.get_default_config_dir"), pytest.raises(ConfigError) as exc_info:  # noqa: PT011
             get_config()
@@ -157,37 +172,35 @@ class TestConfig:
         mock_read_config.assert_called_once()
         assert "notification.threshold must be one of" in str(exc_info.value)
 
-    @mock.patch("siun.config._read_config", mock_read_config)
-    def test_xdg_state_home_set(self, default_config):
+    def test_xdg_state_home_set(self, monkeypatch):
         """Test XDG_STATE_HOME being set."""
+        monkeypatch.setenv("XDG_STATE_HOME", "/tmp/siun-tests/state")  # noqa: S108
         with (
-            mock.patch.dict(environ, clear=True),
             mock.patch("pathlib.Path.exists", return_value=True),
             mock.patch("pathlib.Path.is_file", return_value=True),
         ):
-            environ["XDG_STATE_HOME"] = "/tmp/siun-tests/state"  # noqa: S108
             config = get_config()
 
         assert config.state_dir == Path("/tmp/siun-tests/state/siun")  # noqa: S108
 
-    @mock.patch("siun.config._read_config", side_effect=OSError)
-    def test_os_error(self, default_config):
+    @pytest.mark.read_config(side_effect=OSError)
+    def test_os_error(self):
         """Test handling of OSError."""
         with mock.patch("siun.config.get_default_config_dir"), pytest.raises(ConfigError) as exc_info:  # noqa: PT011
             get_config()
 
         assert "failed to open config file" in str(exc_info.value)
 
-    @mock.patch("siun.config._read_config", side_effect=tomllib.TOMLDecodeError)
-    def test_toml_error(self, default_config):
+    @pytest.mark.read_config(side_effect=tomllib.TOMLDecodeError)
+    def test_toml_error(self):
         """Test handling of TOMLDecodeError."""
         with mock.patch("siun.config.get_default_config_dir"), pytest.raises(ConfigError) as exc_info:  # noqa: PT011
             get_config()
 
         assert "config file not valid" in str(exc_info.value)
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_W_NEWS))
-    def test_config_with_news_source(self, default_config):
+    @pytest.mark.read_config(PARSED_W_NEWS)
+    def test_config_with_news_source(self):
         """Test config with news source."""
         with (
             mock.patch("pathlib.Path.exists", return_value=True),
@@ -202,26 +215,44 @@ class TestConfig:
         assert news_source.max_items == 1
 
 
-@pytest.mark.usefixtures("patch_is_path_world_writable")
+@pytest.fixture(scope="class")
+def patch_default_config_dir():
+    """Mock default config dir, so get_config finds a config file to read."""
+    with mock.patch("siun.config.get_default_config_dir"):
+        yield
+
+
+@pytest.mark.usefixtures("patch_is_path_world_writable", "patch_default_config_dir")
 class TestThresholdsConfig:
     """Test config with v2 thresholds."""
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_LEGACY_THRESHOLDS))
-    def test_legacy_thresholds_raises_error(self, mock_read_config):
-        """Test config using legacy 'thresholds' dict."""
-        with mock.patch("siun.config.get_default_config_dir"), pytest.raises(ConfigError) as exc_info:
+    @pytest.mark.parametrize(
+        "expected_error",
+        [
+            pytest.param(
+                "deprecated config fields: \n- 'thresholds'",
+                marks=pytest.mark.read_config(PARSED_LEGACY_THRESHOLDS),
+                id="legacy",
+            ),
+            pytest.param(
+                "threshold must have a unique name",
+                marks=pytest.mark.read_config(PARSED_W_DUPLICATE_T_NAMES),
+                id="duplicate_names",
+            ),
+        ],
+    )
+    def test_invalid_thresholds_raise_error(self, mock_read_config, expected_error):
+        """Test config using legacy 'thresholds' dict or duplicate v2_thresholds names."""
+        with pytest.raises(ConfigError) as exc_info:
             get_config()
 
         mock_read_config.assert_called_once()
-        assert "deprecated config fields: \n- 'thresholds'" in str(exc_info.value)
+        assert expected_error in str(exc_info.value)
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_V2_THRESHOLDS))
+    @pytest.mark.read_config(PARSED_V2_THRESHOLDS)
     def test_v2_thresholds(self, mock_read_config):
         """Test config using v2_thresholds list."""
-        with (
-            mock.patch("siun.config.get_default_config_dir"),
-        ):
-            config = get_config()
+        config = get_config()
 
         names = [t.name for t in config.v2_thresholds]
         scores = [t.score for t in config.v2_thresholds]
@@ -232,30 +263,15 @@ class TestThresholdsConfig:
         assert set(colors) == {ClickColor.red, ClickColor.yellow, ClickColor.green}
         mock_read_config.assert_called_once()
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_W_DUPLICATE_T_NAMES))
-    def test_v2_thresholds_name_uniqueness(self, mock_read_config):
-        """Test v2_thresholds require unique names."""
-        with (
-            mock.patch("siun.config.get_default_config_dir"),
-            pytest.raises(ConfigError) as exc_info,
-        ):
-            get_config()
-
-        mock_read_config.assert_called_once()
-        assert "threshold must have a unique name" in str(exc_info.value)
 
-
-@pytest.mark.usefixtures("patch_is_path_world_writable")
+@pytest.mark.usefixtures("patch_is_path_world_writable", "patch_default_config_dir")
 class TestCriteriaConfig:
     """Test config with v2 criteria."""
 
-    @mock.patch("siun.config._read_config", return_value=tomllib.loads(CONFIG_LEGACY_CRITERIA))
+    @pytest.mark.read_config(PARSED_LEGACY_CRITERIA)
     def test_legacy_criteria_raises_error(self, mock_read_config):
         """Test config using legacy 'criteria' dict."""
-        with (
-            mock.patch("siun.config.get_default_config_dir"),
-            pytest.raises(ConfigError) as exc_info,
-        ):
+        with pytest.raises(ConfigError) as exc_info:
             get_config()
 
         mock_read_config.assert_called_once()
@@ -1,59 +1,43 @@
 """Test formatting module."""
 
+import json
+
 import pytest
 
 from siun.formatting import Formatter
 
-
-@pytest.mark.parametrize(
-    "format_object_fixture,expected_output",
-    [
-        ("format_object_ok", "Ok"),
-        ("format_object_available", "Updates available"),
-        ("format_object_recommended", "Updates recommended"),
-        ("format_object_required", "Updates required"),
-    ],
-)
-def test_plain(request, format_object_fixture, expected_output):
-    """Test plain formatter."""
-    format_object = request.getfixturevalue(format_object_fixture)
-    output, output_kwargs = Formatter.format_plain(format_object)
-    assert output == expected_output
-    assert output_kwargs == {}
+FORMATTER_CASES = [
+    ("format_plain", "format_object_ok", "Ok", {}),
+    ("format_plain", "format_object_available", "Updates available", {}),
+    ("format_plain", "format_object_recommended", "Updates recommended", {}),
+    ("format_plain", "format_object_required", "Updates required", {}),
+    ("format_fancy", "format_object_ok", "Ok", {"fg": "green"}),
+    ("format_fancy", "format_object_available", "Updates available", {"fg": "blue"}),
+    ("format_fancy", "format_object_recommended", "Updates recommended", {"fg": "yellow"}),
+    ("format_fancy", "format_object_required", "Updates required", {"fg": "red"}),
+    ("format_json", "format_object_ok", '{"count": 0, "text_value": "Ok", "score": 0}', {}),
+    ("format_json", "format_object_available", '{"count": 0, "text_value": "Updates available", "score": 0}', {}),
+    ("format_json", "format_object_recommended", '{"count": 0, "text_value": "Updates recommended", "score": 0}', {}),
+    ("format_json", "format_object_required", '{"count": 0, "text_value": "Updates required", "score": 0}', {}),
+]
 
 
-@pytest.mark.parametrize(
-    "format_object_fixture,expected_output,expected_kwargs",
-    [
-        ("format_object_ok", "Ok", {"fg": "green"}),
-        ("format_object_available", "Updates available", {"fg": "blue"}),
-        ("format_object_recommended", "Updates recommended", {"fg": "yellow"}),
-        ("format_object_required", "Updates required", {"fg": "red"}),
-    ],
-)
-def test_fancy(request, format_object_fixture, expected_output, expected_kwargs):
-    """Test fancy formatter."""
+@pytest.mark.parametrize("method_name,format_object_fixture,expected_output,expected_kwargs", FORMATTER_CASES)
+def test_formatter(request, method_name, format_object_fixture, expected_output, expected_kwargs):
+    """Test plain, fancy, and JSON formatters."""
     format_object = request.getfixturevalue(format_object_fixture)
-    output, output_kwargs = Formatter.format_fancy(format_object)
+    output, output_kwargs = getattr(Formatter, method_name)(format_object)
     assert output == expected_output
     assert output_kwargs == expected_kwargs
 
 
-@pytest.mark.parametrize(
-    "format_object_fixture,expected_output,expected_kwargs",
-    [
-        ("format_object_ok", '{"count": 0, "text_value": "Ok", "score": 0}', {}),
-        ("format_object_available", '{"count": 0, "text_value": "Updates available", "score": 0}', {}),
-        ("format_object_recommended", '{"count": 0, "text_value": "Updates recommended", "score": 0}', {}),
-        ("format_object_required", '{"count": 0, "text_value": "Updates required", "score": 0}', {}),
-    ],
-)
-def test_json(request, format_object_fixture, expected_output, expected_kwargs):
-    """Test JSON formatter."""
-    format_object = request.getfixturevalue(format_object_fixture)
-    output, output_kwargs = Formatter.format_json(format_object)
-    assert output == expected_output
-    assert output_kwargs == expected_kwargs
+def test_json_escapes_text(format_object_factory):
+    """Test JSON formatter output matches json.dumps for text requiring escaping."""
+    status_text = 'Updates "required" \\ ünïcode'
+    format_object = format_object_factory(status_text=status_text, update_count=3, score=5)
+    output, _ = Formatter.format_json(format_object)
+    assert output == json.dumps({"count": 3, "text_value": status_text, "score": 5})
+    assert json.loads(output)["text_value"] == status_text
 
 
 def test_json_handles_count_correctly(format_object_factory):
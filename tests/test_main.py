@@ -1,6 +1,5 @@
 """Test main function and CLI."""
 
-import datetime
 from pathlib import Path
 from unittest import mock
 
@@ -11,7 +10,7 @@ from siun.cli import _handle_notification
 from siun.errors import SiunNotificationError
 from siun.models import CriterionAvailable, CriterionCount
 from siun.providers import UpdateProvider
-from siun.state import Updates, get_merged_criteria
+from siun.state import get_merged_criteria
 
 
 class TestMain:
@@ -48,20 +47,27 @@ class TestMain:
         _handle_notification(config, state)
         notification.show.assert_not_called()
 
-    @mock.patch("siun.cli.Updates.persist_state")
-    @mock.patch("siun.check.load_state")
+    @mock.patch("siun.cli.INSTALLED_FEATURES", {"notification"})
+    def test__handle_notification_reuses_format_object(self, notification_mock, format_object_available):
+        """Test _handle_notification uses passed format object instead of building a new one."""
+        notification = notification_mock("available")
+        config = mock.Mock()
+        config.notification = notification
+        config.mapped_thresholds = {"available": mock.Mock(score=1)}
+        state = mock.Mock()
+        state.match = mock.Mock(score=1)
+        state.last_match = None
+
+        _handle_notification(config, state, format_object_available)
+        notification.fill_templates.assert_called_once_with(format_object_available)
+        notification.show.assert_called_once()
+
     def test_existing_state_sets_required_fields(
-        self, mock_load_state, mock_persist_state, v2_config_w_custom_format, updates_single
+        self, patched_check, updates_factory, v2_config_w_custom_format, updates_single
     ):
         """Test loaded state receives required values from config."""
-        loaded_state = Updates(
-            criteria_settings=[],
-            thresholds=[],
-            available_updates=[updates_single],
-            matched_criteria={},
-            last_update=datetime.datetime.now(tz=datetime.UTC),
-        )
-        mock_load_state.return_value = loaded_state
+        loaded_state = updates_factory(criteria_settings=[], thresholds=[], available_updates=[updates_single])
+        patched_check.load_state.return_value = loaded_state
 
         config_criteria = [
             CriterionAvailable(name="available", weight=1),
@@ -84,13 +90,11 @@ class TestMain:
         assert result.thresholds == v2_config_w_custom_format.v2_thresholds
         assert result.available_updates == [updates_single]
 
-    @mock.patch("siun.check.get_package_updates", return_value=[])
-    @mock.patch("siun.cli.Updates.persist_state")
-    @mock.patch("siun.check.load_state")
     def test_get_updates_persist_state_on_match_change(
-        self, mock_load_state, mock_persist_state, mock_get_package_updates, default_thresholds
+        self, monkeypatch, patched_check, updates_factory, default_thresholds
     ):
         """Test persist_state called when last_match != match."""
+        monkeypatch.setattr("siun.check.get_package_updates", lambda update_providers: [])
         threshold1 = default_thresholds[0]
         threshold2 = default_thresholds[-1]
 
@@ -98,16 +102,13 @@ class TestMain:
             self.match = threshold2  # new match
 
         with mock.patch("siun.state.Updates.evaluate", evaluate_side_effect):
-            state = Updates(
+            state = updates_factory(
                 criteria_settings=[],
                 thresholds=[threshold1, threshold2],
-                available_updates=[],
-                matched_criteria={},
-                last_update=datetime.datetime.now(tz=datetime.UTC),
                 match=threshold1,
                 last_match=threshold2,
             )
-            mock_load_state.return_value = state
+            patched_check.load_state.return_value = state
 
             get_updates(
                 no_cache=False,
@@ -120,31 +121,21 @@ class TestMain:
                 criteria_dict={threshold1.name: threshold1, threshold2.name: threshold2},
             )
 
-        mock_persist_state.assert_called_once()
+        patched_check.persist_state.assert_called_once()
 
-    @mock.patch("siun.check.get_package_updates", return_value=[])
-    @mock.patch("siun.cli.Updates.persist_state")
-    @mock.patch("siun.check.load_state")
     def test_get_updates_no_persist_state_when_match_unchanged(
-        self, mock_load_state, mock_persist_state, mock_get_package_updates, default_thresholds
+        self, monkeypatch, patched_check, updates_factory, default_thresholds
     ):
         """Test persist_state not called when last_match == match."""
+        monkeypatch.setattr("siun.check.get_package_updates", lambda update_providers: [])
         threshold = default_thresholds[0]
 
         def evaluate_side_effect(self, criteria, available_updates):
             pass  # match remains unchanged
 
         with mock.patch("siun.state.Updates.evaluate", evaluate_side_effect):
-            state = Updates(
-                criteria_settings=[],
-                thresholds=[threshold],
-                available_updates=[],
-                matched_criteria={},
-                last_update=datetime.datetime.now(tz=datetime.UTC),
-                match=threshold,
-                last_match=threshold,
-            )
-            mock_load_state.return_value = state
+            state = updates_factory(criteria_settings=[], thresholds=[threshold], match=threshold, last_match=threshold)
+            patched_check.load_state.return_value = state
 
             get_updates(
                 no_cache=False,
@@ -157,4 +148,4 @@ class TestMain:
                 criteria_dict={threshold.name: threshold},
             )
 
-        mock_persist_state.assert_not_called()
+        patched_check.persist_state.assert_not_called()
@@ -64,27 +64,27 @@ class TestUpdateProviderPacman:
             PackageUpdate(name="siun", old_version="1.0.0", new_version="2.0.0", provider="pacman")
         ]
 
+    @pytest.mark.parametrize(
+        ("error", "expected_message"),
+        [
+            pytest.param(PermissionError("Permission denied"), "Permission denied", id="cmd_fails"),
+            pytest.param(
+                FileNotFoundError(2, "No such file or directory", ":"),
+                "No such file or directory: ':'",
+                id="cmd_not_found",
+            ),
+        ],
+    )
     @mock.patch("siun.providers.pacman.UpdateProviderPacman.pick_cmd", return_value=[":"])
-    @mock.patch("subprocess.run", side_effect=PermissionError("Permission denied"))
-    def test_fetch_updates_cmd_fails(self, mock_run, mock_pick_cmd):
-        """Test fetch_updates with failing cmd."""
+    def test_fetch_updates_errors(self, mock_pick_cmd, error, expected_message):
+        """Test fetch_updates with failing or missing cmd."""
         provider = UpdateProviderPacman()
-        with pytest.raises(UpdateProviderError) as excinfo:
-            provider.fetch_updates()
-        assert "Permission denied" in str(excinfo.value)
-
-    @mock.patch("siun.providers.pacman.UpdateProviderPacman.pick_cmd", return_value=[":"])
-    def test_fetch_updates_cmd_not_found(self, fp):
-        """Test fetch_updates with cmd not installed."""
-        provider = UpdateProviderPacman()
-        with pytest.raises(UpdateProviderError) as excinfo:
+        with mock.patch("subprocess.run", side_effect=error), pytest.raises(UpdateProviderError) as excinfo:
             provider.fetch_updates()
-        assert "No such file or directory: ':'" in str(excinfo.value)
+        assert expected_message in str(excinfo.value)
 
-    def test_fetch_updates_invalid_cmd(self, fp):
+    def test_fetch_updates_invalid_cmd(self):
         """Test fetch_updates with invalid cmd."""
-        fp.register([":"], stdout="")
-
         with pytest.raises(ValidationError):
             UpdateProviderPacman(cmd="this_should_be_a_list.sh")
 
@@ -92,10 +92,9 @@ class TestUpdateProviderPacman:
 class TestUpdateProviderGeneric:
     """Test UpdateProviderGeneric."""
 
-    def test_custom_pattern(self, fp):
+    @mock.patch("subprocess.run", return_value=mock.Mock(stdout="siun 2.7.18", returncode=0))
+    def test_custom_pattern(self, mock_run):
         """Test parse_updates with custom pattern."""
-        fp.register([":"], stdout="siun 2.7.18")
-
         provider = UpdateProviderGeneric(cmd=[":"], pattern=r"(?P<name>[a-z]+)\s+(?P<new_version>[0-9\.]+)")
         available_updates = provider.fetch_updates()
         assert available_updates == [
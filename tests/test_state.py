@@ -2,118 +2,132 @@
 
 import io
 import stat
-from os import environ
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
 from siun.errors import CriterionError
-from siun.models import CriterionCustom, FormatObject, PackageUpdate, Updates
+from siun.models import ClickColor, CriterionCustom, FormatObject, PackageUpdate, Updates
 from siun.state import BUILTIN_CRITERIA, _load_user_criteria, get_merged_criteria, load_state
-from siun.util import get_default_criteria_dir
+from siun.util import get_default_criteria_dir, safely_write_to_disk
+
+STATE_JSON = (
+    b"{"
+    b'"last_update": "1970-01-01T01:00:00Z", '
+    b'"state": "OK", '
+    b'"matched_criteria": {}, "available_updates": [{"name": "siun", "provider": "pacman"}]'
+    b"}"
+)
+# `state` is deprecated
+STATE_JSON_DEPRECATED_TYPES = (
+    b"{"
+    b'"last_update": "1970-01-01T01:00:00Z", '
+    b'"state": "OK", "thresholds": [], '
+    b'"matched_criteria": {}, "available_updates": []'
+    b"}"
+)
+# `py-type` struct is deprecated
+STATE_JSON_DEPRECATED_CUSTOM_TYPES = (
+    b"{"
+    b'"last_update": "1970-01-01T01:00:00Z", '
+    b'"state": {"py-type": "State", "value": "OK"}, "thresholds": [], '
+    b'"matched_criteria": {}, "available_updates": []'
+    b"}"
+)
+
+CRITERION_SOURCE = """class SiunCriterion:
+    def is_fulfilled(self, criteria_settings, available_updates):
+        return True
+"""
 
 
 class TestUpdates:
     """Test Updates class."""
 
-    def test_defaults_ok(self, default_config, default_thresholds):
-        """Test no available updates."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
-        updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=[])
-        result = updates.text_value
-
-        assert result == "No matches."
-
-    def test_defaults_available(self, default_config, default_thresholds, updates_single):
-        """Test available updates."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
-        updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=[updates_single])
-        result = updates.text_value
-
-        assert result == "Updates available"
-
-    def test_defaults_recommended(self, default_config, default_thresholds):
-        """Test recommended updates."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
-        updates.evaluate(
-            criteria=BUILTIN_CRITERIA,
-            available_updates=[
-                PackageUpdate(name="siun", provider="pacman"),
-                PackageUpdate(name="linux", provider="pacman"),
-            ],
-        )
-        result = updates.text_value
-
-        assert result == "Updates recommended"
-
-    def test_defaults_required(self, default_config, default_thresholds):
-        """Test required updates."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
-        updates.evaluate(
-            criteria=BUILTIN_CRITERIA,
-            available_updates=[
-                PackageUpdate(name="siun", provider="pacman"),
-                PackageUpdate(name="linux", provider="pacman"),
-                *[PackageUpdate(name="package", provider="pacman")] * 15,
-            ],
-        )
-        result = updates.text_value
-
-        assert result == "Updates required"
-
-    @mock.patch("siun.state.Path.open")
-    def test_read_state(self, mock_open):
-        """Test reading existing state."""
-        json_content = io.StringIO(
-            "{"
-            '"last_update": "1970-01-01T01:00:00Z", '
-            '"state": "OK", '
-            '"matched_criteria": {}, "available_updates": [{"name": "siun", "provider": "pacman"}]'
-            "}"
-        )
-        mock_open.return_value = json_content
-        mock_file = mock.MagicMock()
-        updates = load_state(mock_file)
-
-        assert updates
-        assert updates.available_updates == [PackageUpdate(name="siun", provider="pacman")]
-
-    @mock.patch("siun.state.Path.open")
-    def test_read_state_handles_deprecated_types(self, mock_open):
-        """Test loading state from disk handles custom types."""
-        # `state` is deprecated
-        json_content = io.StringIO(
-            "{"
-            '"last_update": "1970-01-01T01:00:00Z", '
-            '"state": "OK", "thresholds": [], '
-            '"matched_criteria": {}, "available_updates": []'
-            "}"
+    @pytest.mark.parametrize(
+        ("available_updates", "expected"),
+        [
+            pytest.param([], "No matches.", id="ok"),
+            pytest.param([PackageUpdate(name="siun", provider="name")], "Updates available", id="available"),
+            pytest.param(
+                [PackageUpdate(name="siun", provider="pacman"), PackageUpdate(name="linux", provider="pacman")],
+                "Updates recommended",
+                id="recommended",
+            ),
+            pytest.param(
+                [
+                    PackageUpdate(name="siun", provider="pacman"),
+                    PackageUpdate(name="linux", provider="pacman"),
+                    *[PackageUpdate(name="package", provider="pacman")] * 15,
+                ],
+                "Updates required",
+                id="required",
+            ),
+        ],
+    )
+    def test_defaults(self, updates_factory, available_updates, expected):
+        """Test text value of default thresholds for available updates."""
+        updates = updates_factory()
+        updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=available_updates)
+
+        assert updates.text_value == expected
+
+    def test_evaluate_defaults_to_no_updates(self, updates_single, updates_factory):
+        """Test evaluate without available updates resets previous updates."""
+        updates = updates_factory()
+        updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=(updates_single,))
+        assert updates.available_updates == [updates_single]
+
+        updates.evaluate(criteria=BUILTIN_CRITERIA)
+        assert updates.available_updates == []
+        assert updates.matched_criteria == {}
+
+    def test_evaluate_skips_criteria_requiring_updates(self):
+        """Test criteria requiring available updates are not checked without updates."""
+        requires_updates = mock.Mock(requires_updates=True)
+        always_checked = mock.Mock(requires_updates=False)
+        always_checked.is_fulfilled.return_value = True
+        updates = Updates(
+            criteria_settings=[CriterionCustom(name="requires", weight=1), CriterionCustom(name="always", weight=1)]
         )
-        mock_open.return_value = json_content
-        mock_file = mock.MagicMock()
-        updates = load_state(mock_file)
-
+        updates.evaluate(criteria={"requires": requires_updates, "always": always_checked})
+
+        requires_updates.is_fulfilled.assert_not_called()
+        always_checked.is_fulfilled.assert_called_once()
+        assert list(updates.matched_criteria) == ["always"]
+
+    def test_last_update_defaults_to_now(self, frozen_now):
+        """Test last_update defaults to the current time."""
+        assert Updates().last_update == frozen_now
+
+    @pytest.mark.parametrize(
+        ("state_json", "available_updates"),
+        [
+            pytest.param(STATE_JSON, [PackageUpdate(name="siun", provider="pacman")], id="current"),
+            pytest.param(STATE_JSON_DEPRECATED_TYPES, [], id="deprecated_types"),
+            pytest.param(STATE_JSON_DEPRECATED_CUSTOM_TYPES, [], id="deprecated_custom_types"),
+        ],
+    )
+    def test_read_state(self, state_json, available_updates):
+        """Test reading existing state, deprecated types are treated like unknown state."""
+        state_file = mock.MagicMock()
+        with mock.patch("siun.state.Path.open", return_value=io.BytesIO(state_json)) as mock_open:
+            updates = load_state(state_file)
+
+        mock_open.assert_called_once_with(state_file, "rb")
         assert updates
-        assert updates.available_updates == []
+        assert updates.available_updates == available_updates
         assert updates.match is None
 
-    @mock.patch("siun.state.Path.open")
-    def test_read_state_handles_deprecated_custom_types(self, mock_open):
-        """Test loading state from disk handles custom types."""
-        # `py-type` struct is deprecated
-        json_content = io.StringIO(
-            "{"
-            '"last_update": "1970-01-01T01:00:00Z", '
-            '"state": {"py-type": "State", "value": "OK"}, "thresholds": [], '
-            '"matched_criteria": {}, "available_updates": []'
-            "}"
-        )
-        mock_open.return_value = json_content
-        mock_file = mock.MagicMock()
-        updates = load_state(mock_file)
+    def test_safely_write_to_disk(self, tmp_path):
+        """Test writing state replaces target without leaving temporary files behind."""
+        state_file = tmp_path / "state" / "state.json"
+        safely_write_to_disk(content="{}", target_path=state_file)
+        safely_write_to_disk(content='{"available_updates": []}', target_path=state_file)
 
-        assert updates.match is None  # Deprecated type is treated like unknown state
+        assert state_file.read_text() == '{"available_updates": []}'
+        assert list(state_file.parent.iterdir()) == [state_file]
 
     def test_load_state_file_missing(self, tmp_path):
         """Test loading state if state file does not exist."""
@@ -127,8 +141,6 @@ class TestUpdates:
         self,
         mock_load_user_criteria,
         default_config,
-        default_thresholds,
-        updates_single,
     ):
         """Test get_merged_criteria raises CriterionError if user criteria loading fails."""
         with pytest.raises(CriterionError) as excinfo:
@@ -136,9 +148,9 @@ class TestUpdates:
 
         assert "Error loading criteria: fail!" in str(excinfo.value)
 
-    def test_format_object_populated(self, default_config, default_thresholds):
+    def test_format_object_populated(self, default_thresholds, updates_factory):
         """Test format_object returns correct values for populated state."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
+        updates = updates_factory()
         updates.available_updates = [
             PackageUpdate(name="siun", provider="pacman"),
             PackageUpdate(name="linux", provider="pacman"),
@@ -157,25 +169,27 @@ class TestUpdates:
         assert fmt.status_text == updates.text_value
         assert fmt.update_count == 2
 
-    def test_match_reset_when_no_thresholds_matched(self, default_config, default_thresholds):
+    def test_match_reset_when_no_thresholds_matched(self, default_thresholds, updates_factory):
         """Test that match is reset to None when score is below all thresholds."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
+        updates = updates_factory()
         updates.match = default_thresholds[-1]
         updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=[])
         assert updates.match is None
+        assert updates.text_value == "No matches."
+        assert updates.color == ClickColor.reset
 
     @pytest.mark.parametrize("updates_multiple", [2], indirect=True)
-    def test_match_not_reset_if_threshold_matched(self, default_config, default_thresholds, updates_multiple):
+    def test_match_not_reset_if_threshold_matched(self, updates_multiple, updates_factory):
         """Test that match is set if a threshold is matched."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
+        updates = updates_factory()
         updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=updates_multiple)
         assert updates.match is not None
         assert updates.match.score <= updates.score
 
     @pytest.mark.parametrize("updates_multiple", [3], indirect=True)
-    def test_match_reset_on_score_drop(self, default_config, default_thresholds, updates_multiple):
+    def test_match_reset_on_score_drop(self, updates_multiple, updates_factory):
         """Test that match is reset if score drops below all thresholds after being previously set."""
-        updates = Updates(thresholds=default_thresholds, criteria_settings=default_config.v2_criteria)
+        updates = updates_factory()
         updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=updates_multiple)
         assert updates.match is not None
         updates.evaluate(criteria=BUILTIN_CRITERIA, available_updates=[])
@@ -183,50 +197,42 @@ class TestUpdates:
         assert updates.match is None
 
 
+@pytest.fixture(scope="module")
+def criteria_dir(tmp_path_factory):
+    """Criteria dir containing a custom criterion, shared by the custom criteria tests."""
+    include_path = tmp_path_factory.mktemp("criteria")
+    (include_path / "test_criterion.py").write_text(CRITERION_SOURCE)
+    return include_path
+
+
 class TestCustomCriteria:
     """Test custom criteria."""
 
-    def test_load_custom_criterion(self, tmp_path):
+    def test_load_custom_criterion(self, criteria_dir, monkeypatch):
         """Test custom criteria can be loaded."""
         criteria_settings = [CriterionCustom(name="test_criterion", weight=2)]
-        include_path = tmp_path / "criteria"
-        include_path.mkdir()
-        criterion_content = """class SiunCriterion:
-    def is_fulfilled(self, criteria_settings, available_updates):
-        return True
-        """
-        with Path.open(include_path / Path("test_criterion.py"), "w+") as criterion_file:
-            criterion_file.write(criterion_content)
-        user_criteria = _load_user_criteria(criteria_settings=criteria_settings, include_path=include_path)
+        monkeypatch.setattr("sys.dont_write_bytecode", True)  # Don't cache bytecode for a throwaway criterion
+        user_criteria = _load_user_criteria(criteria_settings=criteria_settings, include_path=criteria_dir)
         assert user_criteria
         assert "test_criterion" in user_criteria
 
     @pytest.mark.parametrize("criteria_settings", [[CriterionCustom(name="test_criterion", weight=0)], []])
-    def test_custom_criterion_not_loaded_wo_weight(self, tmp_path, criteria_settings):
+    def test_custom_criterion_not_loaded_wo_weight(self, criteria_dir, criteria_settings):
         """Test custom criteria not getting loaded without a configured weight."""
-        include_path = tmp_path / "criteria"
-        include_path.mkdir()
-        criterion_content = """class SiunCriterion:
-    def is_fullfilled(self, criteria_settings, available_updates):
-        return True
-        """
-        with Path.open(include_path / Path("test_criterion.py"), "w+") as criterion_file:
-            criterion_file.write(criterion_content)
-        user_criteria = _load_user_criteria(criteria_settings=criteria_settings, include_path=include_path)
+        user_criteria = _load_user_criteria(criteria_settings=criteria_settings, include_path=criteria_dir)
         assert isinstance(user_criteria, dict)
         assert "test_criterion" not in user_criteria
 
-    def test__default_criteria_dir(self):
+    def test__default_criteria_dir(self, monkeypatch):
         """Test get_default_criteria_dir with XDG_CONFIG_HOME set."""
-        with mock.patch.dict(environ, clear=True):
-            environ["XDG_CONFIG_HOME"] = "/tmp/siun-tests/config"  # noqa: S108
-            assert get_default_criteria_dir() == Path("/tmp/siun-tests/config/siun/criteria")  # noqa: S108
+        monkeypatch.setenv("XDG_CONFIG_HOME", "/tmp/siun-tests/config")  # noqa: S108
+        assert get_default_criteria_dir() == Path("/tmp/siun-tests/config/siun/criteria")  # noqa: S108
 
-    def test__default_criteria_dir_wo_config_home(self):
+    def test__default_criteria_dir_wo_config_home(self, monkeypatch):
         """Test get_default_criteria_dir without XDG_CONFIG_HOME set."""
-        with mock.patch.dict(environ, clear=True):
-            environ["HOME"] = "/tmp/siun-tests/no_config_home"  # noqa: S108
-            assert get_default_criteria_dir() == Path("/tmp/siun-tests/no_config_home/.config/siun/criteria")  # noqa: S108
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        monkeypatch.setenv("HOME", "/tmp/siun-tests/no_config_home")  # noqa: S108
+        assert get_default_criteria_dir() == Path("/tmp/siun-tests/no_config_home/.config/siun/criteria")  # noqa: S108
 
     def test_load_user_criteria_world_writable_dir(self, tmp_path):
         """Test _load_user_criteria exception if criteria dir is world-writable."""